@@ -1,192 +1,82 @@
 #!/usr/bin/env python3
 """
-Hybrid Nornir MAC-Adressen Scanner 
-NAPALM für IOS, Netmiko für NX-OS (wenn NXAPI nicht verfügbar)
+Nornir MAC-Adressen Scanner
+Modus "hybrid" (Standard): NAPALM für IOS, Netmiko für NX-OS (wenn NXAPI nicht verfügbar)
+Modus "netmiko": Netmiko mit TextFSM für alle Plattformen
 
 Autor: Network Automation Script (Hybrid Version)
 Datum: September 2025
 """
 
+import os
 import sys
-import csv
-from datetime import datetime
+import time
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from rich.console import Console
-from rich.table import Table
-from rich import print as rprint
 from nornir import InitNornir
-from nornir_napalm.plugins.tasks import napalm_get
-from nornir_netmiko.tasks import netmiko_send_command
-from nornir_utils.plugins.functions import print_result
 
+from mac_scanner.common import CSV_BUFFER_SIZE, CsvExportProcessor, display_results, display_summary
 
-def get_mac_addresses_hybrid(task):
-    """
-    Hybrid-Funktion: NAPALM für IOS, Netmiko für NX-OS
-    """
-    try:
-        if 'nxos' in task.host.platform.lower():
-            # NX-OS: Verwende Netmiko wegen NXAPI-Problemen
-            result = task.run(
-                task=netmiko_send_command,
-                command_string="show mac address-table",
-                name="MAC Address Table - NX-OS (Netmiko)"
-            )
-            return result
-        else:
-            # IOS: Verwende NAPALM für strukturierte Daten
-            result = task.run(
-                task=napalm_get,
-                getters=["mac_address_table"],
-                name="MAC Address Table - IOS (NAPALM)"
-            )
-            return result
-    except Exception as e:
-        task.host["error"] = f"Fehler beim Abrufen der MAC-Tabelle: {str(e)}"
-        return None
+# Arbeitsverzeichnis einmal beim Import ermitteln - die CSV-Datei wird relativ dazu geschrieben
+_CWD = os.getcwd()
 
 
-def process_mac_data_hybrid(result, platform):
+def load_scanner(mode):
     """
-    Verarbeitet MAC-Daten je nach Quelle (NAPALM JSON oder Netmiko String)
+    Importiert das Modul des gewählten Modus
     """
-    mac_entries = []
-    
-    if 'nxos' in platform.lower():
-        # NX-OS Netmiko String-Parsing
-        if hasattr(result, 'result') and isinstance(result.result, str):
-            output = result.result
-            lines = output.split('\n')
-            
-            for line in lines:
-                line = line.strip()
-                # NX-OS Format: "*    1     000c.2937.a1ae   dynamic  NA         F      F    Eth1/1"
-                if line and line.startswith('*') and 'dynamic' in line.lower():
-                    parts = line.split()
-                    if len(parts) >= 7:  # Mindestens: * VLAN MAC Type Age Secure NTFY Port
-                        try:
-                            vlan = parts[1]
-                            mac_addr = parts[2] 
-                            port = parts[-1]  # Letzter Part ist der Port
-                            
-                            # Validiere MAC-Adresse Format (xxxx.xxxx.xxxx)
-                            if '.' in mac_addr and len(mac_addr.replace('.', '')) == 12:
-                                mac_entries.append({
-                                    'vlan': vlan,
-                                    'mac': mac_addr,
-                                    'type': 'dynamic',
-                                    'port': port
-                                })
-                        except (IndexError, ValueError):
-                            continue
-    else:
-        # IOS NAPALM JSON-Verarbeitung
-        if hasattr(result, 'result') and isinstance(result.result, dict):
-            mac_address_table = result.result.get('mac_address_table', [])
-            
-            for entry in mac_address_table:
-                if entry.get('active', True):
-                    # MAC-Adresse von aa:bb:cc:dd:ee:ff zu aabb.ccdd.eeff
-                    mac_raw = entry.get('mac', '').lower()
-                    if ':' in mac_raw:
-                        parts = mac_raw.split(':')
-                        if len(parts) == 6:
-                            mac_cisco = f"{parts[0]}{parts[1]}.{parts[2]}{parts[3]}.{parts[4]}{parts[5]}"
-                        else:
-                            mac_cisco = mac_raw.replace(':', '')
-                    else:
-                        mac_cisco = mac_raw
-                    
-                    mac_entries.append({
-                        'vlan': str(entry.get('vlan', 1)),
-                        'mac': mac_cisco,
-                        'type': 'static' if entry.get('static', False) else 'dynamic',
-                        'port': entry.get('interface', 'unknown')
-                    })
-    
-    return mac_entries
+    if mode == "netmiko":
+        from mac_scanner import netmiko_only
+        return netmiko_only
+    from mac_scanner import hybrid
+    return hybrid
 
 
-def export_to_csv(results, console, nr):
+def parse_args(default_mode="hybrid"):
     """
-    Exportiert die MAC-Adressen Ergebnisse in eine CSV-Datei
+    Kommandozeilen-Argumente auswerten
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    csv_filename = f"mac_addresses_{timestamp}.csv"
-    
-    try:
-        with open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['hostname', 'ip_address', 'platform', 'vlan', 'mac_address', 'type', 'port']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            # Header schreiben
-            writer.writeheader()
-            
-            # Daten schreiben
-            for hostname, result in results.items():
-                if 'mac_entries' in result:
-                    host = nr.inventory.hosts[hostname]
-                    for entry in result['mac_entries']:
-                        writer.writerow({
-                            'hostname': hostname,
-                            'ip_address': host.hostname,
-                            'platform': result.get('platform', host.platform),
-                            'vlan': entry['vlan'],
-                            'mac_address': entry['mac'],
-                            'type': entry['type'], 
-                            'port': entry['port']
-                        })
-        
-        console.print(f"[bold green]📁 CSV-Export erfolgreich: {csv_filename}[/bold green]")
-        return csv_filename
-        
-    except Exception as e:
-        console.print(f"[bold red]❌ CSV-Export fehlgeschlagen: {str(e)}[/bold red]")
-        return None
+    parser = argparse.ArgumentParser(description="Nornir MAC-Adressen Scanner für Cisco IOS und NX-OS")
+    parser.add_argument(
+        "--mode",
+        choices=["hybrid", "netmiko"],
+        default=default_mode,
+        help="hybrid: NAPALM für IOS, Netmiko für NX-OS - netmiko: Netmiko mit TextFSM für alle Plattformen"
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Vor dem Scan einen Verbindungstest (show version) über dieselbe Verbindung ausführen"
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Alle MAC-Adressen als Tabelle pro Switch anzeigen (Standard: nur Anzahl pro Switch, Details in der CSV)"
+    )
+    parser.add_argument(
+        "--parse-processes",
+        type=int,
+        default=0,
+        metavar="N",
+        help="MAC-Tabellen in N separaten Prozessen parsen, während die übrigen Abfragen weiterlaufen "
+             "(sinnvoll bei sehr großen Tabellen, Standard: 0 = im Worker-Thread parsen)"
+    )
+    return parser.parse_args()
 
 
-def display_results(results, console):
-    """
-    Zeigt die Ergebnisse in einer formattierten Tabelle an
-    """
-    for hostname, result in results.items():
-        console.print(f"\n[bold blue]═══ {hostname.upper()} ═══[/bold blue]")
-        
-        if 'error' in result:
-            console.print(f"[bold red]❌ Fehler: {result['error']}[/bold red]")
-            continue
-            
-        if not result['mac_entries']:
-            console.print("[yellow]⚠️  Keine MAC-Adressen gefunden[/yellow]")
-            continue
-            
-        # Tabelle für MAC-Adressen erstellen
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("VLAN", style="cyan")
-        table.add_column("MAC-Adresse", style="green")  
-        table.add_column("Typ", style="yellow")
-        table.add_column("Port/Interface", style="blue")
-        
-        for entry in result['mac_entries']:
-            table.add_row(
-                entry['vlan'],
-                entry['mac'], 
-                entry['type'],
-                entry['port']
-            )
-            
-        console.print(table)
-        method = "NAPALM (JSON)" if 'ios' in result.get('platform', '').lower() else "Netmiko (String)"
-        console.print(f"[dim]Gesamt: {len(result['mac_entries'])} MAC-Adressen gefunden - {method}[/dim]")
-
-
-def main():
+def main(default_mode="hybrid"):
     """
     Hauptfunktion
     """
-    console = Console()
-    console.print("[bold green]🚀 Hybrid MAC-Adressen Scanner[/bold green]")
-    console.print("[cyan]🔧 NAPALM für IOS, Netmiko für NX-OS[/cyan]")
+    args = parse_args(default_mode)
+    # Kein Auto-Highlighting - spart Rich die Regex-Suche in jeder Zelle
+    console = Console(highlight=False)
+    scanner = load_scanner(args.mode)
+    console.print("[bold green]🚀 MAC-Adressen Scanner[/bold green]")
+    console.print(f"[cyan]🔧 Methode: {scanner.MODE_LABEL}[/cyan]")
     
     # Überprüfe ob config.yaml existiert
     if not Path("config.yaml").exists():
@@ -202,73 +92,71 @@ def main():
         # Ergebnis-Dictionary initialisieren  
         results = {}
         
-        # Alle Switches mit Hybrid-Methode verarbeiten
-        console.print(f"[cyan]🔄 Verarbeite {len(nr.inventory.hosts)} Switch(es) hybrid...[/cyan]")
-        hybrid_results = nr.run(task=get_mac_addresses_hybrid)
+        # CSV-Datei vorab öffnen - jeder Switch wird geschrieben, sobald er fertig ist
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        csv_file = f"mac_addresses_{timestamp}.csv"
         
-        for hostname, task_result in hybrid_results.items():
-            if task_result.failed:
-                results[hostname] = {"error": f"Task fehlgeschlagen: {task_result.exception}"}
+        # Alle Switches verarbeiten
+        console.print(f"[cyan]🔄 Verarbeite {len(nr.inventory.hosts)} Switch(es) ({args.mode})...[/cyan]")
+        parse_executor = None
+        if args.parse_processes > 0:
+            # "spawn" statt fork: die Worker starten erst beim ersten submit() aus einem Nornir-Thread,
+            # während andere Threads SSH-Verbindungen halten - fork kann dabei im Kind hängen bleiben
+            parse_executor = ProcessPoolExecutor(
+                max_workers=args.parse_processes,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        try:
+            with open(csv_file, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
+                csv_export = CsvExportProcessor(csvfile, keep_entries=args.pretty)
+                scan_results = nr.with_processors([csv_export]).run(
+                    task=scanner.get_mac_addresses,
+                    verify=args.verify,
+                    parse_executor=parse_executor
+                )
+                csvfile.flush()
+        finally:
+            if parse_executor is not None:
+                parse_executor.shutdown()
+        console.print(f"[bold green]📁 CSV-Export erfolgreich: {csv_file}[/bold green]")
+        
+        # Anzahl (und mit --pretty die MAC-Einträge) liegen bereits in den Host-Daten
+        for hostname, host in nr.inventory.hosts.items():
+            if hostname in scan_results.failed_hosts:
+                # Das letzte fehlgeschlagene Result ist die eigentliche Ursache: ein Netmiko/NAPALM-Subtask
+                # oder - wenn z.B. das Parsen scheitert - der Haupt-Task selbst (Index 0)
+                failed_result = next(r for r in reversed(scan_results[hostname]) if r.failed)
+                results[hostname] = {"error": f"Fehler in {failed_result.name}: {failed_result.exception}"}
             else:
-                host = nr.inventory.hosts[hostname]
-                platform = host.platform
-                
-                # Zugriff auf das Result je nach Platform
-                try:
-                    if 'nxos' in platform.lower():
-                        # NX-OS Netmiko Result (verschachtelt wie bei der Debug-Ausgabe)
-                        netmiko_multiresult = task_result[0]  # Erster Task
-                        if len(netmiko_multiresult.result) > 0:
-                            actual_netmiko_result = netmiko_multiresult.result[0]  # Verschachteltes Result
-                            if actual_netmiko_result.failed:
-                                results[hostname] = {"error": f"Netmiko-Fehler: {actual_netmiko_result.exception}"}
-                            else:
-                                mac_entries = process_mac_data_hybrid(actual_netmiko_result, platform)
-                                results[hostname] = {
-                                    "mac_entries": mac_entries,
-                                    "platform": platform,
-                                    "method": "Netmiko"
-                                }
-                        else:
-                            results[hostname] = {"error": "Leeres Netmiko Result"}
-                    else:
-                        # IOS NAPALM Result (verschachtelt)
-                        nested_multiresult = task_result[0].result
-                        napalm_result = nested_multiresult[0]
-                        
-                        if napalm_result.failed:
-                            results[hostname] = {"error": f"NAPALM-Fehler: {napalm_result.exception}"}
-                        else:
-                            mac_entries = process_mac_data_hybrid(napalm_result, platform)
-                            results[hostname] = {
-                                "mac_entries": mac_entries,
-                                "platform": platform,
-                                "method": "NAPALM"
-                            }
-                except Exception as e:
-                    results[hostname] = {"error": f"Result-Verarbeitung fehlgeschlagen: {str(e)}"}
+                results[hostname] = {
+                    "count": host.get("mac_count", 0),
+                    "platform": host.platform,
+                    "method": scanner.scan_method(host.platform)
+                }
+                if args.pretty:
+                    results[hostname]["mac_entries"] = host.get("mac_entries", [])
         
         # Ergebnisse anzeigen
         console.print("\n[bold yellow]📊 ERGEBNISSE[/bold yellow]")
-        display_results(results, console)
-        
-        # CSV Export
-        csv_file = export_to_csv(results, console, nr)
+        if args.pretty:
+            display_results(results, console)
+        else:
+            display_summary(results, console)
         
         # Zusammenfassung
-        total_macs = sum(len(result.get('mac_entries', [])) for result in results.values())
-        successful_devices = sum(1 for result in results.values() if 'mac_entries' in result)
+        # Erfolgreiche Geräte einmal herausfiltern - danach kein 'count'-Check mehr pro Zähler
+        good = [result for result in results.values() if 'count' in result]
+        total_macs = sum(result['count'] for result in good)
+        successful_devices = len(good)
         failed_devices = len(results) - successful_devices
         
         console.print(f"\n[bold green]📈 ZUSAMMENFASSUNG[/bold green]")
         console.print(f"[green]✅ Erfolgreich verbundene Switches: {successful_devices}[/green]")
         console.print(f"[red]❌ Fehlgeschlagene Verbindungen: {failed_devices}[/red]")
         console.print(f"[blue]📋 Gesamt MAC-Adressen gefunden: {total_macs}[/blue]")
-        console.print(f"[magenta]🔧 Methode: Hybrid (NAPALM + Netmiko)[/magenta]")
+        console.print(f"[magenta]🔧 Methode: {scanner.MODE_LABEL}[/magenta]")
         
-        if csv_file:
-            current_dir = Path().absolute()
-            console.print(f"[cyan]💾 CSV-Datei gespeichert unter: {current_dir}/{csv_file}[/cyan]")
+        console.print(f"[cyan]💾 CSV-Datei gespeichert unter: {_CWD}/{csv_file}[/cyan]")
         
     except Exception as e:
         console.print(f"[bold red]💥 Kritischer Fehler: {str(e)}[/bold red]")
@@ -277,5 +165,19 @@ def main():
     console.print("\n[bold green]✨ Scanner beendet[/bold green]")
 
 
+def main_hybrid():
+    """
+    Einstiegspunkt für den Hybrid-Modus (NAPALM für IOS, Netmiko für NX-OS)
+    """
+    main(default_mode="hybrid")
+
+
+def main_netmiko_only():
+    """
+    Einstiegspunkt für den Netmiko-Modus (TextFSM für alle Plattformen)
+    """
+    main(default_mode="netmiko")
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,7 @@
+"""
+Gemeinsame Bausteine des Nornir MAC-Adressen Scanners
+
+- common:       MAC-Eintrag, CSV-Export und Ausgabe (für alle Modi)
+- hybrid:       NAPALM für IOS, Netmiko für NX-OS
+- netmiko_only: Netmiko mit TextFSM für alle Plattformen
+"""
@@ -0,0 +1,150 @@
+"""
+Gemeinsame Funktionen aller Scanner-Modi: MAC-Eintrag, CSV-Export und Ausgabe
+"""
+
+from __future__ import annotations
+
+import csv
+import threading
+from typing import NamedTuple
+from rich.table import Table
+
+
+# Maximale Wartezeit (Sekunden) auf die Ausgabe eines Befehls
+READ_TIMEOUT = 30
+
+# Prompt im privilegierten ("switch#") oder User-Exec-Mode ("switch>") - als expect_string
+# muss Netmiko den Prompt nicht erst per find_prompt() ermitteln und kehrt sofort nach dem Prompt zurück
+PROMPT_PATTERN = r'[>#]\s*$'
+
+# Schreibpuffer der CSV-Datei (1 MiB) - weniger write()-Syscalls bei großen Exporten
+CSV_BUFFER_SIZE = 1 << 20
+
+# Ab dieser Anzahl Einträge wird statt einer Rich-Tabelle reiner Text ausgegeben -
+# das Rendern der Tabelle kostet bei großen Switches mehr als das Scannen selbst
+PLAIN_TABLE_THRESHOLD = 500
+
+CSV_HEADER = ['hostname', 'ip_address', 'platform', 'vlan', 'mac_address', 'type', 'port']
+
+
+class MacEntry(NamedTuple):
+    """
+    Ein MAC-Eintrag als Tuple statt Dict - deutlich weniger Speicher pro Eintrag
+    """
+    vlan: str
+    mac: str
+    type: str
+    port: str
+
+
+class CsvExportProcessor:
+    """
+    Nornir-Processor: schreibt die MAC-Einträge jedes Switches direkt nach
+    Abschluss seines Tasks in die CSV-Datei, statt alle Ergebnisse zu puffern
+    """
+
+    def __init__(self, csvfile, keep_entries=False):
+        self.writer = csv.writer(csvfile)
+        self.writer.writerow(CSV_HEADER)
+        # Einträge nur für die Tabellenausgabe (--pretty) in den Host-Daten behalten
+        self.keep_entries = keep_entries
+        # Die Tasks laufen parallel im ThreadPool
+        self.lock = threading.Lock()
+
+    def task_instance_completed(self, task, host, result):
+        if result.failed:
+            return
+        entries = host.get("mac_entries", [])
+        # Host-Attribute einmal pro Switch auflösen, nicht pro Zeile
+        hostname, ip, platform = host.name, host.hostname, host.platform
+        with self.lock:
+            self.writer.writerows(
+                (hostname, ip, platform, e.vlan, e.mac, e.type, e.port)
+                for e in entries
+            )
+        # Nach dem Schreiben reicht die Anzahl - die Liste wird sonst bis Laufende gehalten
+        host["mac_count"] = len(entries)
+        if not self.keep_entries:
+            host.data.pop("mac_entries", None)
+
+    def task_started(self, task):
+        pass
+
+    def task_completed(self, task, result):
+        pass
+
+    def task_instance_started(self, task, host):
+        pass
+
+    def subtask_instance_started(self, task, host):
+        pass
+
+    def subtask_instance_completed(self, task, host, result):
+        pass
+
+
+def run_parser(parse_executor, parser, *args):
+    """
+    Führt einen Parser direkt im Worker-Thread aus oder - wenn ein
+    ProcessPoolExecutor übergeben wird - in einem separaten Prozess.
+    Der Thread wartet dann ohne GIL, sodass die übrigen Abfragen und das
+    Parsen auf mehreren Kernen parallel laufen.
+    """
+    if parse_executor is None:
+        return parser(*args)
+    return parse_executor.submit(parser, *args).result()
+
+
+def display_results(results, console):
+    """
+    Zeigt die Ergebnisse in einer formattierten Tabelle an
+    """
+    for hostname, result in results.items():
+        console.print(f"\n[bold blue]═══ {hostname.upper()} ═══[/bold blue]")
+        
+        if 'error' in result:
+            console.print(f"[bold red]❌ Fehler: {result['error']}[/bold red]")
+            continue
+            
+        if not result['mac_entries']:
+            console.print("[yellow]⚠️  Keine MAC-Adressen gefunden[/yellow]")
+            continue
+            
+        entries = result['mac_entries']
+        
+        if len(entries) > PLAIN_TABLE_THRESHOLD:
+            # Große Tabellen als ausgerichteten Text in einem print() ausgeben
+            lines = [f"{'VLAN':<6} {'MAC-Adresse':<15} {'Typ':<8} Port/Interface"]
+            lines.extend(f"{vlan:<6} {mac:<15} {mac_type:<8} {port}" for vlan, mac, mac_type, port in entries)
+            console.print("\n".join(lines), markup=False, highlight=False)
+            console.print(f"[dim]Gesamt: {len(entries)} MAC-Adressen gefunden - {result['method']}[/dim]")
+            continue
+            
+        # Tabelle für MAC-Adressen erstellen
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("VLAN", style="cyan")
+        table.add_column("MAC-Adresse", style="green")  
+        table.add_column("Typ", style="yellow")
+        table.add_column("Port/Interface", style="blue")
+        
+        # MacEntry hat bereits die Spaltenreihenfolge der Tabelle
+        add_row = table.add_row
+        for entry in entries:
+            add_row(*entry)
+            
+        console.print(table)
+        console.print(f"[dim]Gesamt: {len(entries)} MAC-Adressen gefunden - {result['method']}[/dim]")
+
+
+def display_summary(results, console):
+    """
+    Kompakte Ausgabe: eine Zeile pro Switch statt einer Tabelle aller MAC-Adressen
+    
+    Braucht nur 'count' und 'method' je Ergebnis - auch vom NAPALM-Skript genutzt,
+    das die MAC-Einträge nach dem CSV-Export nicht mehr vorhält.
+    """
+    for hostname, result in results.items():
+        if 'error' in result:
+            console.print(f"[bold red]❌ {hostname}: {result['error']}[/bold red]")
+        else:
+            console.print(f"[green]{hostname}: {result['count']} MAC-Adressen ({result['method']})[/green]")
@@ -0,0 +1,130 @@
+"""
+Hybrid-Modus: NAPALM für IOS, Netmiko für NX-OS (wenn NXAPI nicht verfügbar)
+"""
+
+from __future__ import annotations
+
+import re
+from nornir.core.task import Result, Task
+
+from mac_scanner.common import PROMPT_PATTERN, READ_TIMEOUT, MacEntry, run_parser
+
+
+MODE_LABEL = "Hybrid (NAPALM + Netmiko)"
+
+# NX-OS Format: "*    1     000c.2937.a1ae   dynamic  NA         F      F    Eth1/1"
+# Gruppen: VLAN, MAC-Adresse (xxxx.xxxx.xxxx), Port (letzte Spalte)
+# NX-OS gibt "dynamic" immer klein aus - ohne re.IGNORECASE entfällt das Case-Folding pro Zeichen
+_NXOS_MAC_RE = re.compile(
+    r'^[ \t]*\*[ \t]+(\d+)[ \t]+([0-9a-fA-F]{4}\.[0-9a-fA-F]{4}\.[0-9a-fA-F]{4})[ \t]+dynamic\b.*[ \t](\S+)[ \t\r]*$',
+    re.MULTILINE
+)
+
+
+def scan_method(platform: str) -> str:
+    """
+    Beschreibt, wie die MAC-Tabelle eines Switches dieser Plattform abgefragt wird
+    """
+    return "Netmiko (Regex)" if 'nxos' in platform.lower() else "NAPALM (TextFSM)"
+
+
+def netmiko_send_multiline(task: Task, commands: list[str]) -> Result:
+    """
+    Schickt mehrere Befehle über send_multiline() in einem Aufruf
+    (eine Prompt-Erkennung statt einer pro Befehl) und gibt die gesamte Ausgabe zurück
+    """
+    net_connect = task.host.get_connection("netmiko", task.nornir.config)
+    return Result(
+        host=task.host,
+        result=net_connect.send_multiline(commands, read_timeout=READ_TIMEOUT, expect_string=PROMPT_PATTERN)
+    )
+
+
+def get_mac_addresses(task: Task, verify: bool = False, parse_executor=None) -> None:
+    """
+    Hybrid-Funktion: NAPALM für IOS, Netmiko für NX-OS
+    Legt die verarbeiteten MAC-Einträge unter task.host["mac_entries"] ab, damit
+    der CsvExportProcessor sie direkt nach Abschluss des Switches schreiben kann
+
+    Mit verify=True wird zusätzlich ein Verbindungstest (show version) im
+    selben Aufruf wie die MAC-Abfrage ausgeführt. Mit parse_executor wird die
+    Ausgabe in einem separaten Prozess geparst (siehe run_parser).
+
+    Die Task-Plugins werden erst hier importiert. Das spart kaum Zeit: NAPALM und
+    Netmiko selbst lädt bereits InitNornir über die registrierten Connection-Plugins.
+    """
+    if 'nxos' in task.host.platform.lower():
+        from nornir_netmiko.tasks import netmiko_send_command
+        
+        # NX-OS: Verwende Netmiko wegen NXAPI-Problemen
+        if verify:
+            # Beide Befehle in einem send_multiline() - die Regex ignoriert die show version Zeilen
+            result = task.run(
+                task=netmiko_send_multiline,
+                commands=["show version | head -10", "show mac address-table"],
+                name="Connectivity Test + MAC Address Table - NX-OS (Netmiko)"
+            )
+        else:
+            result = task.run(
+                task=netmiko_send_command,
+                command_string="show mac address-table",
+                read_timeout=READ_TIMEOUT,
+                expect_string=PROMPT_PATTERN,
+                name="MAC Address Table - NX-OS (Netmiko)"
+            )
+        task.host["mac_entries"] = run_parser(parse_executor, parse_nxos_output, result[0].result)
+    else:
+        from nornir_napalm.plugins.tasks import napalm_cli
+        
+        # IOS: NAPALM cli() liefert die Rohausgabe, geparst wird mit TextFSM
+        # statt mit dem zeilenweisen Python-Parser des mac_address_table Getters
+        commands = ["show mac address-table"]
+        name = "MAC Address Table - IOS (NAPALM)"
+        if verify:
+            # Verbindungstest im selben cli()-Aufruf - napalm_get kennt keinen "cli"-Getter
+            commands.insert(0, "show version | include Software")
+            name = "Connectivity Test + MAC Address Table - IOS (NAPALM)"
+        # NAPALMs IOS-Treiber ruft send_command() ohne read_timeout auf (Netmiko-Standard: 10 s) -
+        # read_timeout_override der darunterliegenden Netmiko-Verbindung gilt auch für diese Aufrufe
+        task.host.get_connection("napalm", task.nornir.config).device.read_timeout_override = READ_TIMEOUT
+        result = task.run(
+            task=napalm_cli,
+            commands=commands,
+            name=name
+        )
+        task.host["mac_entries"] = run_parser(
+            parse_executor, parse_ios_output, result[0].result["show mac address-table"]
+        )
+
+
+def parse_nxos_output(output: str) -> list[MacEntry]:
+    """
+    Parst die Netmiko-Ausgabe von "show mac address-table" (NX-OS)
+    """
+    # Ohne dynamische Einträge muss die Regex gar nicht erst laufen
+    if 'dynamic' not in output:
+        return []
+    # Eine Regex über die gesamte Ausgabe - filtert dynamische Einträge und validiert die MAC
+    return [
+        MacEntry(vlan=match.group(1), mac=match.group(2), type='dynamic', port=match.group(3))
+        for match in _NXOS_MAC_RE.finditer(output)
+    ]
+
+
+def parse_ios_output(output: str) -> list[MacEntry]:
+    """
+    Parst die Ausgabe von "show mac address-table" (IOS) mit dem ntc-templates TextFSM-Template
+    """
+    from ntc_templates.parse import parse_output
+    
+    parsed = parse_output(platform="cisco_ios", command="show mac address-table", data=output)
+    # Einträge mit VLAN "All" sind CPU/System-Adressen des Switches
+    return [
+        MacEntry(
+            vlan=entry['vlan_id'],
+            mac=entry['destination_address'],
+            type=entry['type'].lower(),
+            port=', '.join(entry['destination_port'])
+        )
+        for entry in parsed if entry['vlan_id'].isdigit()
+    ]
@@ -0,0 +1,81 @@
+"""
+Netmiko-Modus: alle Plattformen per Netmiko, geparst mit den ntc-templates (TextFSM)
+"""
+
+from __future__ import annotations
+
+from nornir.core.task import Task
+
+from mac_scanner.common import PROMPT_PATTERN, READ_TIMEOUT, MacEntry, run_parser
+
+
+MODE_LABEL = "Netmiko (TextFSM)"
+
+
+def scan_method(platform: str) -> str:
+    """
+    Beschreibt, wie die MAC-Tabelle eines Switches dieser Plattform abgefragt wird
+    """
+    return "Netmiko (TextFSM)"
+
+
+def get_mac_addresses(task: Task, verify: bool = False, parse_executor=None) -> None:
+    """
+    Fragt die MAC-Tabelle per Netmiko ab und legt die dynamischen Einträge
+    unter task.host["mac_entries"] ab
+
+    Mit verify=True läuft vorher ein Verbindungstest (show version) über
+    dieselbe Netmiko-Verbindung. Mit parse_executor wird die Ausgabe in einem
+    separaten Prozess geparst (siehe run_parser).
+    """
+    # Task-Plugin erst hier importieren - Netmiko selbst hat InitNornir bereits geladen
+    from nornir_netmiko.tasks import netmiko_send_command
+    
+    is_nxos = 'nxos' in task.host.platform.lower()
+    platform_name = "NX-OS" if is_nxos else "IOS"
+    
+    if verify:
+        task.run(
+            task=netmiko_send_command,
+            command_string="show version | head -10" if is_nxos else "show version | include Software",
+            read_timeout=READ_TIMEOUT,
+            expect_string=PROMPT_PATTERN,
+            name=f"Connectivity Test - {platform_name}"
+        )
+    
+    # Rohausgabe holen und selbst mit TextFSM parsen (statt use_textfsm=True),
+    # damit das Parsen bei Bedarf in einen eigenen Prozess ausgelagert werden kann
+    result = task.run(
+        task=netmiko_send_command,
+        command_string="show mac address-table",
+        read_timeout=READ_TIMEOUT,
+        expect_string=PROMPT_PATTERN,
+        name=f"MAC Address Table - {platform_name}"
+    )
+    task.host["mac_entries"] = run_parser(parse_executor, parse_textfsm_output, result[0].result, is_nxos)
+
+
+def parse_textfsm_output(output: str, is_nxos: bool) -> list[MacEntry]:
+    """
+    Parst "show mac address-table" mit dem ntc-templates TextFSM-Template
+    der Plattform und gibt nur die dynamischen MAC-Adressen zurück
+    """
+    from ntc_templates.parse import parse_output
+    
+    if is_nxos:
+        parsed = parse_output(platform="cisco_nxos", command="show mac address-table", data=output)
+        return [
+            MacEntry(vlan=e['vlan_id'], mac=e['mac_address'], type=e['type'].lower(), port=e['ports'])
+            for e in parsed if e['type'].lower() == 'dynamic'
+        ]
+    
+    parsed = parse_output(platform="cisco_ios", command="show mac address-table", data=output)
+    return [
+        MacEntry(
+            vlan=e['vlan_id'],
+            mac=e['destination_address'],
+            type=e['type'].lower(),
+            port=', '.join(e['destination_port'])
+        )
+        for e in parsed if e['type'].lower() == 'dynamic'
+    ]
@@ -0,0 +1,3 @@
+"""
+Ältere Varianten des Scanners - Aufruf als Modul, z.B. python3 -m versions.get_mac_addresses_napalm
+"""
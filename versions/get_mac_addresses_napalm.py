@@ -3,44 +3,39 @@
 Modernized Nornir MAC-Address Scanner with NAPALM
 Strukturierte JSON-Daten statt String-Parsing
 
+Aufruf aus dem Projektverzeichnis als Modul (damit mac_scanner importierbar ist):
+    python3 -m versions.get_mac_addresses_napalm
+
 Autor: Network Automation Script (NAPALM Version)
 Datum: September 2025
 """
 
+import os
 import sys
-import csv
-from datetime import datetime
+import time
 from pathlib import Path
 from rich.console import Console
-from rich.table import Table
 from rich import print as rprint
 from nornir import InitNornir
-from nornir_napalm.plugins.tasks import napalm_get
 from nornir_utils.plugins.functions import print_result
 
+from mac_scanner.common import CSV_BUFFER_SIZE, CSV_HEADER, MacEntry, display_summary
+
+# Arbeitsverzeichnis einmal beim Import ermitteln - die CSV-Datei wird relativ dazu geschrieben
+_CWD = os.getcwd()
 
-def get_mac_addresses(task):
-    """
-    Funktion zum Abrufen der MAC-Adressen mit NAPALM (JSON)
-    Funktioniert für alle unterstützten Plattformen (IOS, NX-OS, etc.)
-    """
-    try:
-        # NAPALM MAC Address Table abrufen - gibt strukturierte Daten zurück
-        result = task.run(
-            task=napalm_get,
-            getters=["mac_address_table"],
-            name="NAPALM MAC Address Table"
-        )
-        return result
-    except Exception as e:
-        task.host["error"] = f"Fehler beim Abrufen der MAC-Tabelle: {str(e)}"
-        return None
+
+# Übersetzungstabelle zum Entfernen der Doppelpunkte aus NAPALM-MAC-Adressen
+_COLON_TABLE = str.maketrans('', '', ':')
 
 
 def process_napalm_mac_data(mac_data, platform):
     """
     Verarbeitet NAPALM MAC-Address-Daten (JSON) zu unserem Format
     
+    Liefert MacEntry-Tuples als Generator - jeder Eintrag wird direkt in die
+    CSV geschrieben, es entsteht keine zweite Liste neben den NAPALM-Daten.
+    
     NAPALM Format:
     [
       {
@@ -54,104 +49,22 @@ def process_napalm_mac_data(mac_data, platform):
       }
     ]
     """
-    mac_entries = []
-    
     for entry in mac_data:
+        get = entry.get
         # Nur aktive MAC-Adressen (static können interessant sein, also auch inkludieren)
-        if entry.get('active', True):
+        if get('active', True):
             # MAC-Adresse normalisieren - NAPALM gibt bereits Standard-Format
-            mac_raw = entry.get('mac', '').lower()
-            
-            # Von aa:bb:cc:dd:ee:ff zu aabb.ccdd.eeff (Cisco-Format für CSV)
-            if ':' in mac_raw:
-                parts = mac_raw.split(':')
-                if len(parts) == 6:
-                    mac_cisco = f"{parts[0]}{parts[1]}.{parts[2]}{parts[3]}.{parts[4]}{parts[5]}"
-                else:
-                    mac_cisco = mac_raw.replace(':', '')  # fallback
-            else:
-                mac_cisco = mac_raw
+            # Von aa:bb:cc:dd:ee:ff zu aabb.ccdd.eeff (Cisco-Format für CSV):
+            # Doppelpunkte in einem translate()-Durchlauf entfernen, Punkte per Slicing setzen
+            s = get('mac', '').lower().translate(_COLON_TABLE)
+            mac_cisco = f"{s[:4]}.{s[4:8]}.{s[8:]}" if len(s) == 12 else s
                 
-            mac_entries.append({
-                'vlan': str(entry.get('vlan', 1)),
-                'mac': mac_cisco,
-                'type': 'static' if entry.get('static', False) else 'dynamic',
-                'port': entry.get('interface', 'unknown')
-            })
-    
-    return mac_entries
-
-
-def export_to_csv(results, console, nr):
-    """
-    Exportiert die MAC-Adressen Ergebnisse in eine CSV-Datei
-    """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    csv_filename = f"mac_addresses_{timestamp}.csv"
-    
-    try:
-        with open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['hostname', 'ip_address', 'platform', 'vlan', 'mac_address', 'type', 'port']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            # Header schreiben
-            writer.writeheader()
-            
-            # Daten schreiben
-            for hostname, result in results.items():
-                if 'mac_entries' in result:
-                    host = nr.inventory.hosts[hostname]
-                    for entry in result['mac_entries']:
-                        writer.writerow({
-                            'hostname': hostname,
-                            'ip_address': host.hostname,
-                            'platform': result.get('platform', host.platform),
-                            'vlan': entry['vlan'],
-                            'mac_address': entry['mac'],
-                            'type': entry['type'], 
-                            'port': entry['port']
-                        })
-        
-        console.print(f"[bold green]📁 CSV-Export erfolgreich: {csv_filename}[/bold green]")
-        return csv_filename
-        
-    except Exception as e:
-        console.print(f"[bold red]❌ CSV-Export fehlgeschlagen: {str(e)}[/bold red]")
-        return None
-
-
-def display_results(results, console):
-    """
-    Zeigt die Ergebnisse in einer formattierten Tabelle an
-    """
-    for hostname, result in results.items():
-        console.print(f"\n[bold blue]═══ {hostname.upper()} ═══[/bold blue]")
-        
-        if 'error' in result:
-            console.print(f"[bold red]❌ Fehler: {result['error']}[/bold red]")
-            continue
-            
-        if not result['mac_entries']:
-            console.print("[yellow]⚠️  Keine MAC-Adressen gefunden[/yellow]")
-            continue
-            
-        # Tabelle für MAC-Adressen erstellen
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("VLAN", style="cyan")
-        table.add_column("MAC-Adresse", style="green")  
-        table.add_column("Typ", style="yellow")
-        table.add_column("Port/Interface", style="blue")
-        
-        for entry in result['mac_entries']:
-            table.add_row(
-                entry['vlan'],
-                entry['mac'], 
-                entry['type'],
-                entry['port']
+            yield MacEntry(
+                vlan=str(get('vlan', 1)),
+                mac=mac_cisco,
+                type='static' if get('static', False) else 'dynamic',
+                port=get('interface', 'unknown')
             )
-            
-        console.print(table)
-        console.print(f"[dim]Gesamt: {len(result['mac_entries'])} MAC-Adressen gefunden[/dim]")
 
 
 def main():
@@ -169,55 +82,75 @@ def main():
         sys.exit(1)
     
     try:
+        # Task-Plugin - NAPALM selbst wird von InitNornir ohnehin über das Connection-Plugin geladen
+        from nornir_napalm.plugins.tasks import napalm_get
+        
         # Nornir initialisieren
         nr = InitNornir(config_file="config.yaml")
         console.print(f"[green]✅ {len(nr.inventory.hosts)} Geräte in der Inventarliste geladen[/green]")
         
-        # Ergebnis-Dictionary initialisieren  
+        # Pro Gerät nur Anzahl bzw. Fehler für die Anzeige behalten
         results = {}
+        total_macs = 0
+        successful_devices = 0
         
         # Alle Geräte mit NAPALM verarbeiten
         console.print(f"[cyan]🔄 Verarbeite {len(nr.inventory.hosts)} Gerät(e) mit NAPALM...[/cyan]")
-        napalm_results = nr.run(task=get_mac_addresses)
+        # Runner und Worker-Anzahl kommen aus config.yaml - wie beim Hauptskript
+        # napalm_get direkt als Task - ohne Wrapper-Task gibt es nur eine Result-Ebene
+        napalm_results = nr.run(
+            task=napalm_get,
+            getters=["mac_address_table"],
+            name="NAPALM MAC Address Table"
+        )
+        
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        csv_file = f"mac_addresses_{timestamp}.csv"
+        
+        # Ein Durchlauf: Einträge pro Gerät direkt in die CSV schreiben, Zähler mitführen
+        with open(csv_file, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
+            # Ohne csv-Modul: NAPALM-Felder (VLAN, MAC, Typ, Interface) enthalten nie
+            # Komma, Anführungszeichen oder Zeilenumbruch - Quoting ist überflüssig
+            csvfile.write(','.join(CSV_HEADER) + '\n')
+            # Methode einmal binden statt pro Zeile über das Datei-Objekt nachzuschlagen
+            write = csvfile.write
+            
+            for hostname, task_result in napalm_results.items():
+                if task_result.failed:
+                    results[hostname] = {"error": f"NAPALM-Fehler: {task_result.exception}"}
+                    continue
+                
+                # NAPALM gibt strukturierte JSON-Daten zurück!
+                napalm_data = task_result[0].result
+                mac_address_table = napalm_data.get('mac_address_table', [])
+                
+                # Host-Attribute einmal in Locals auflösen - Zugriffe auf Nornir-Hosts sind nicht billig
+                host = nr.inventory.hosts[hostname]
+                ip = host.hostname
+                platform = host.platform
+                
+                # Verarbeite JSON zu unserem Format
+                mac_entries = process_napalm_mac_data(mac_address_table, platform)
+                
+                # Pro Host konstanter Zeilenanfang - einmal formatieren statt pro Eintrag
+                prefix = f"{hostname},{ip},{platform},"
+                # Zeilen direkt aus dem Generator schreiben und dabei mitzählen
+                count = 0
+                for vlan, mac, mac_type, port in mac_entries:
+                    write(f"{prefix}{vlan},{mac},{mac_type},{port}\n")
+                    count += 1
+                
+                results[hostname] = {"count": count, "method": "NAPALM (JSON)"}
+                total_macs += count
+                successful_devices += 1
         
-        for hostname, task_result in napalm_results.items():
-            if task_result.failed:
-                results[hostname] = {"error": f"Task fehlgeschlagen: {task_result.exception}"}
-            else:
-                # Zugriff auf das NAPALM-Result - mehrfach verschachtelt!
-                try:
-                    # task_result ist MultiResult -> [0] ist Result -> .result ist MultiResult -> [0] ist Result -> .result ist dict
-                    nested_multiresult = task_result[0].result  # Erste Verschachtelung
-                    napalm_result = nested_multiresult[0]       # Zweite Verschachtelung
-                    
-                    if napalm_result.failed:
-                        results[hostname] = {"error": f"NAPALM-Fehler: {napalm_result.exception}"}
-                    else:
-                        # NAPALM gibt strukturierte JSON-Daten zurück!
-                        napalm_data = napalm_result.result
-                        mac_address_table = napalm_data.get('mac_address_table', [])
-                        
-                        # Verarbeite JSON zu unserem Format
-                        host = nr.inventory.hosts[hostname]
-                        mac_entries = process_napalm_mac_data(mac_address_table, host.platform)
-                        results[hostname] = {
-                            "mac_entries": mac_entries, 
-                            "platform": host.platform,
-                            "napalm_data_count": len(mac_address_table)
-                        }
-                except Exception as e:
-                    results[hostname] = {"error": f"Result-Zugriff fehlgeschlagen: {str(e)}"}
+        console.print(f"[bold green]📁 CSV-Export erfolgreich: {csv_file}[/bold green]")
         
         # Ergebnisse anzeigen
         console.print("\n[bold yellow]📊 ERGEBNISSE[/bold yellow]")
-        display_results(results, console)
-        
-        # CSV Export
-        csv_file = export_to_csv(results, console, nr)
+        display_summary(results, console)
         
         # Zusammenfassung
-        total_macs = sum(len(result.get('mac_entries', [])) for result in results.values())
-        successful_devices = sum(1 for result in results.values() if 'mac_entries' in result)
         failed_devices = len(results) - successful_devices
         
         console.print(f"\n[bold green]📈 ZUSAMMENFASSUNG[/bold green]")
@@ -226,9 +159,7 @@ def main():
         console.print(f"[blue]📋 Gesamt MAC-Adressen gefunden: {total_macs}[/blue]")
         console.print(f"[magenta]🔧 Methode: NAPALM (JSON-basiert)[/magenta]")
         
-        if csv_file:
-            current_dir = Path().absolute()
-            console.print(f"[cyan]💾 CSV-Datei gespeichert unter: {current_dir}/{csv_file}[/cyan]")
+        console.print(f"[cyan]💾 CSV-Datei gespeichert unter: {_CWD}/{csv_file}[/cyan]")
         
     except Exception as e:
         console.print(f"[bold red]💥 Kritischer Fehler: {str(e)}[/bold red]")